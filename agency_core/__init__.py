@@ -15,10 +15,10 @@ Agency Core - Frozen Foundation
 
 __version__ = "1.0.0"
 
-from .asset_io import read_file, write_file, read_image, write_image, read_csv, write_pdf
-from .asset_storage import store_asset, retrieve_asset, list_assets, delete_asset
-from .template_schema import define_template, validate_template_data, get_template
-from .asset_entity import create_asset, update_asset, get_asset, list_assets_by_type, delete_asset_entity
+from .asset_io import read_file, write_file, read_image, write_image, read_csv, iter_csv, read_csv_batches, write_pdf, sanitize_filename
+from .asset_storage import store_asset, retrieve_asset, list_assets, iter_assets, delete_asset
+from .template_schema import define_template, validate_template_data, get_template, compile_validator
+from .asset_entity import create_asset, create_assets, update_asset, get_asset, list_assets_by_type, delete_asset_entity
 from .content_transform import define_transform, apply_transform, list_transforms
 from .workflow_process import define_workflow, execute_workflow, get_workflow
 from .rule_validation import define_rule, validate_asset, list_rules
@@ -26,13 +26,14 @@ from .job_identity import create_job, log_job_execution, get_job, list_jobs
 
 __all__ = [
     # IO
-    'read_file', 'write_file', 'read_image', 'write_image', 'read_csv', 'write_pdf',
+    'read_file', 'write_file', 'read_image', 'write_image', 'read_csv', 'iter_csv', 'read_csv_batches', 'write_pdf',
+    'sanitize_filename',
     # Storage
-    'store_asset', 'retrieve_asset', 'list_assets', 'delete_asset',
+    'store_asset', 'retrieve_asset', 'list_assets', 'iter_assets', 'delete_asset',
     # Schema
-    'define_template', 'validate_template_data', 'get_template',
+    'define_template', 'validate_template_data', 'get_template', 'compile_validator',
     # Entity
-    'create_asset', 'update_asset', 'get_asset', 'list_assets_by_type', 'delete_asset_entity',
+    'create_asset', 'create_assets', 'update_asset', 'get_asset', 'list_assets_by_type', 'delete_asset_entity',
     # Transform
     'define_transform', 'apply_transform', 'list_transforms',
     # Process
@@ -0,0 +1,9 @@
+"""
+Compat - Python version shims shared by core modules
+FROZEN MODULE - Pure stdlib
+"""
+
+import sys
+
+# slots=True is only accepted by dataclass() on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
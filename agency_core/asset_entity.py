@@ -4,12 +4,17 @@ FROZEN MODULE - Pure stdlib
 """
 
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from ._compat import _SLOTS
 
-@dataclass
+# Bound once so the create/update hot paths skip the attribute lookup
+_now = datetime.utcnow
+
+
+@dataclass(**_SLOTS)
 class Asset:
     """Base asset entity."""
     id: str
@@ -21,18 +26,28 @@ class Asset:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        result = asdict(self)
-        result['created_at'] = self.created_at.isoformat()
-        result['updated_at'] = self.updated_at.isoformat()
-        return result
+        return {
+            'id': self.id,
+            'type': self.type,
+            'data': dict(self.data),
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'metadata': dict(self.metadata),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Asset':
         """Create from dictionary."""
-        data = data.copy()
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
-        data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-        return cls(**data)
+        # Positional in field order: no dict copy, no **kwargs unpacking
+        parse = datetime.fromisoformat
+        return cls(
+            data['id'],
+            data['type'],
+            data['data'],
+            parse(data['created_at']),
+            parse(data['updated_at']),
+            data.get('metadata', {}),
+        )
 
 
 class AssetRegistry:
@@ -40,12 +55,14 @@ class AssetRegistry:
 
     def __init__(self):
         self._assets: Dict[str, Asset] = {}
+        # type -> {id: asset}; inner dicts keep creation order
+        self._by_type: Dict[str, Dict[str, Asset]] = {}
 
     def create(self, asset_type: str, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> Asset:
         """Create a new asset."""
-        now = datetime.utcnow()
+        now = _now()
         asset = Asset(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             type=asset_type,
             data=data,
             created_at=now,
@@ -53,8 +70,22 @@ class AssetRegistry:
             metadata=metadata or {}
         )
         self._assets[asset.id] = asset
+        self._by_type.setdefault(asset_type, {})[asset.id] = asset
         return asset
 
+    def create_many(self, asset_type: str, items: Iterable[Dict[str, Any]]) -> List[Asset]:
+        """
+        Create one asset per data dict in items, all of asset_type.
+        Assets share one timestamp and are indexed with one update per dict.
+        """
+        now = _now()
+        uuid4 = uuid.uuid4
+        assets = [Asset(uuid4().hex, asset_type, data, now, now, {}) for data in items]
+        by_id = {asset.id: asset for asset in assets}
+        self._assets.update(by_id)
+        self._by_type.setdefault(asset_type, {}).update(by_id)
+        return assets
+
     def get(self, asset_id: str) -> Optional[Asset]:
         """Get asset by ID."""
         return self._assets.get(asset_id)
@@ -66,19 +97,21 @@ class AssetRegistry:
             return None
 
         asset.data.update(data)
-        asset.updated_at = datetime.utcnow()
+        asset.updated_at = _now()
         return asset
 
     def delete(self, asset_id: str) -> bool:
         """Delete asset by ID."""
-        if asset_id in self._assets:
-            del self._assets[asset_id]
-            return True
-        return False
+        asset = self._assets.pop(asset_id, None)
+        if asset is None:
+            return False
+        # Tolerate asset.type having been reassigned since creation
+        self._by_type.get(asset.type, {}).pop(asset_id, None)
+        return True
 
     def list_by_type(self, asset_type: str) -> List[Asset]:
         """List all assets of a specific type."""
-        return [a for a in self._assets.values() if a.type == asset_type]
+        return list(self._by_type.get(asset_type, {}).values())
 
     def list_all(self) -> List[Asset]:
         """List all assets."""
@@ -94,6 +127,11 @@ def create_asset(asset_type: str, data: Dict[str, Any], metadata: Optional[Dict[
     return _registry.create(asset_type, data, metadata)
 
 
+def create_assets(asset_type: str, items: Iterable[Dict[str, Any]]) -> List[Asset]:
+    """Create an asset of asset_type for each data dict in items."""
+    return _registry.create_many(asset_type, items)
+
+
 def get_asset(asset_id: str) -> Optional[Asset]:
     """Get asset by ID."""
     return _registry.get(asset_id)
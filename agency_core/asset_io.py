@@ -5,49 +5,153 @@ FROZEN MODULE - Pure stdlib, no external dependencies
 
 import csv
 import json
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+# write_csv emits one small write per row; a larger buffer batches them
+# into fewer syscalls than the 8 KiB io.DEFAULT_BUFFER_SIZE.
+_CSV_WRITE_BUFFER = 128 * 1024
+
+# Directories this process has already created or seen, so repeated writes
+# into one output directory skip the mkdir/stat syscalls.
+_known_dirs: Set[Path] = set()
+
+# Characters replaced when a display name becomes a file or folder name
+_FILENAME_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+
+def _as_path(path: Union[str, Path]) -> Path:
+    """Return path as a Path, without re-wrapping values that already are one."""
+    return path if isinstance(path, Path) else Path(path)
+
+
+def sanitize_filename(name: str) -> str:
+    """Turn a display name into a single path component (spaces and slashes -> '_')."""
+    return name.translate(_FILENAME_TABLE)
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) unless it is already known to exist."""
+    if directory not in _known_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(directory)
+
+
+def _write_in_dir(path: Path, write: Callable[[], None]) -> None:
+    """
+    Run write() after making sure path's directory exists.
+    If a cached directory was removed in the meantime the write fails with
+    FileNotFoundError; the directory is then recreated and the write retried.
+    """
+    parent = path.parent
+    cached = parent in _known_dirs
+    _ensure_dir(parent)
+    try:
+        write()
+    except FileNotFoundError:
+        if not cached:
+            raise
+        _known_dirs.discard(parent)
+        _ensure_dir(parent)
+        write()
+
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a whole file through a raw descriptor.
+    Skips the buffered file object; a missing file raises FileNotFoundError.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write a whole in-memory payload through a raw descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def read_file(path: Union[str, Path], encoding: str = 'utf-8') -> str:
     """Read text file."""
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    path = _as_path(path)
     return path.read_text(encoding=encoding)
 
 
 def write_file(path: Union[str, Path], content: str, encoding: str = 'utf-8') -> None:
     """Write text file."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding=encoding)
+    path = _as_path(path)
+    _write_in_dir(path, lambda: path.write_text(content, encoding=encoding))
 
 
 def read_image(path: Union[str, Path]) -> bytes:
     """Read image file as bytes."""
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Image not found: {path}")
-    return path.read_bytes()
+    return _read_bytes(_as_path(path))
 
 
 def write_image(path: Union[str, Path], data: bytes) -> None:
     """Write image file from bytes."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
+    path = _as_path(path)
+    _write_in_dir(path, lambda: _write_bytes(path, data))
+
+
+def iter_csv(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream CSV rows as dictionaries, one row at a time.
+
+    Same row semantics as csv.DictReader (blank lines skipped, short rows
+    padded with None, surplus values under the None key) without its
+    per-row fieldname bookkeeping.
+    """
+    path = _as_path(path)
+    with path.open('r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        for row in reader:
+            if len(row) == width:
+                yield dict(zip(header, row))
+            elif row:
+                record = dict(zip(header, row))
+                if len(row) < width:
+                    for key in header[len(row):]:
+                        record[key] = None
+                else:
+                    record[None] = row[width:]
+                yield record
 
 
 def read_csv(path: Union[str, Path]) -> List[Dict[str, Any]]:
     """Read CSV file as list of dictionaries."""
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"CSV not found: {path}")
+    return list(iter_csv(path))
 
-    with path.open('r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+
+def read_csv_batches(path: Union[str, Path], batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    """Stream CSV rows as lists of at most batch_size dictionaries."""
+    rows = iter_csv(path)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
 def write_csv(path: Union[str, Path], data: List[Dict[str, Any]], fieldnames: Optional[List[str]] = None) -> None:
@@ -55,47 +159,39 @@ def write_csv(path: Union[str, Path], data: List[Dict[str, Any]], fieldnames: Op
     if not data:
         return
 
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    path = _as_path(path)
 
     if fieldnames is None:
         fieldnames = list(data[0].keys())
 
-    with path.open('w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    def write() -> None:
+        with path.open('w', encoding='utf-8', newline='', buffering=_CSV_WRITE_BUFFER) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(data)
+
+    _write_in_dir(path, write)
 
 
 def read_json(path: Union[str, Path]) -> Any:
     """Read JSON file."""
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"JSON not found: {path}")
-
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
-
+    path = _as_path(path)
+    return json.loads(path.read_text(encoding='utf-8'))
 
-def write_json(path: Union[str, Path], data: Any, indent: int = 2) -> None:
-    """Write JSON file."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    with path.open('w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+def write_json(path: Union[str, Path], data: Any, indent: Optional[int] = 2) -> None:
+    """Write JSON file. Pass indent=None for compact (faster) output."""
+    path = _as_path(path)
+    text = json.dumps(data, indent=indent, ensure_ascii=False)
+    _write_in_dir(path, lambda: path.write_text(text, encoding='utf-8'))
 
 
 def write_pdf(path: Union[str, Path], content: bytes) -> None:
     """Write PDF file from bytes."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(content)
+    path = _as_path(path)
+    _write_in_dir(path, lambda: _write_bytes(path, content))
 
 
 def read_pdf(path: Union[str, Path]) -> bytes:
     """Read PDF file as bytes."""
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"PDF not found: {path}")
-    return path.read_bytes()
+    return _read_bytes(_as_path(path))
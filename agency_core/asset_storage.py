@@ -3,9 +3,49 @@ Asset Storage - In-memory key-value store with persistence
 FROZEN MODULE - Pure stdlib
 """
 
+import atexit
+import hashlib
 import json
+import os
+from bisect import bisect_left, insort
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+
+# Values of these types are kept out of the JSON file and written raw to
+# a sidecar file instead of being stringified by json's default=str.
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+
+def _prefix_end(prefix: str) -> Optional[str]:
+    """
+    Smallest string greater than every string starting with prefix, or None
+    if there is none (prefix is all U+10FFFF). Upper bisect bound for prefix.
+    """
+    stripped = prefix.rstrip('\U0010ffff')
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+def _digest(payload: bytes) -> str:
+    """Fingerprint of a storage file payload, recorded in the blob index."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _write_atomic(path: Path, parts: List[Any]) -> None:
+    """Write bytes-like parts to a temp file and rename it over path."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        for part in parts:
+            view = memoryview(part).cast('B')
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 class AssetStore:
@@ -13,30 +53,128 @@ class AssetStore:
 
     def __init__(self, storage_path: Optional[Path] = None):
         self._storage: Dict[str, Any] = {}
+        # Sorted copy of the keys, for O(log N + k) prefix listing
+        self._keys: List[str] = []
         self._storage_path = storage_path or Path('.agency_storage.json')
+        self._blob_path = self._storage_path.with_name(self._storage_path.name + '.blobs')
+        self._has_blob_file = False
+        self._dirty = False
+        self._bulk_depth = 0
         self._load()
 
     def _load(self) -> None:
         """Load storage from disk."""
+        payload = b''
         if self._storage_path.exists():
             try:
-                with self._storage_path.open('r') as f:
-                    self._storage = json.load(f)
+                payload = self._storage_path.read_bytes()
+                self._storage = json.loads(payload)
             except (json.JSONDecodeError, IOError):
                 self._storage = {}
 
+        if self._blob_path.exists():
+            self._has_blob_file = True
+            try:
+                self._storage.update(self._read_blobs(payload))
+            except (ValueError, IOError):
+                pass
+
+        self._keys = sorted(self._storage)
+
+    def _read_blobs(self, payload: bytes) -> Dict[str, bytes]:
+        """
+        Read the binary sidecar file.
+        Layout: 8-byte big-endian index length, JSON index, then the raw
+        value bytes back to back. The index is {"json": digest, "blobs":
+        [[key, size], ...]}; a digest that doesn't match the storage file's
+        payload means a save was torn between the two files, and the blobs
+        are rejected. Older files hold just the [key, size] list.
+        """
+        data = memoryview(self._blob_path.read_bytes())
+        index_size = int.from_bytes(data[:8], 'big')
+        offset = 8 + index_size
+        index = json.loads(bytes(data[8:offset]))
+        if isinstance(index, dict):
+            if index.get('json') != _digest(payload):
+                raise ValueError("Blob file does not match storage file")
+            index = index['blobs']
+        blobs = {}
+        for key, size in index:
+            blobs[key] = bytes(data[offset:offset + size])
+            offset += size
+        if offset != len(data):
+            raise ValueError("Corrupt blob file")
+        return blobs
+
     def _save(self) -> None:
-        """Save storage to disk."""
+        """
+        Save storage to disk atomically.
+        Writes a sibling temp file and renames it over the storage file, so a
+        crash mid-write never leaves a truncated store behind. The blob file
+        is replaced first and records the digest of the storage payload it
+        goes with, so a crash between the two renames is caught on load.
+        """
+        blobs = {k: v for k, v in self._storage.items() if isinstance(v, _BINARY_TYPES)}
+        document = self._storage
+        if blobs:
+            document = {k: v for k, v in self._storage.items() if k not in blobs}
+
+        # Compact one-shot dumps() runs on the C encoder; indent or
+        # json.dump() fall back to the pure-Python one.
+        payload = json.dumps(document, default=str).encode('utf-8')
         try:
-            with self._storage_path.open('w') as f:
-                json.dump(self._storage, f, indent=2, default=str)
+            if blobs:
+                index = json.dumps({
+                    'json': _digest(payload),
+                    'blobs': [[k, memoryview(v).nbytes] for k, v in blobs.items()],
+                }).encode('utf-8')
+                _write_atomic(self._blob_path, [len(index).to_bytes(8, 'big'), index, *blobs.values()])
+                self._has_blob_file = True
+            _write_atomic(self._storage_path, [payload])
+            if not blobs and self._has_blob_file:
+                os.remove(self._blob_path)
+                self._has_blob_file = False
         except IOError:
             pass  # Fail silently on write errors
 
+    def _changed(self) -> None:
+        """Mark storage dirty and save unless inside bulk()."""
+        self._dirty = True
+        if not self._bulk_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Save pending changes to disk."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
+    @contextmanager
+    def bulk(self) -> Iterator['AssetStore']:
+        """
+        Defer saving until the outermost bulk() block exits.
+        M mutations inside the block cost one save instead of M.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                self.flush()
+
     def store(self, key: str, value: Any) -> None:
-        """Store asset by key."""
+        """
+        Store asset by key.
+        Keys must be str: the prefix index keeps them sorted, so it can't
+        hold keys of mixed types (and JSON would turn them into str anyway).
+        """
+        if key not in self._storage:
+            if not isinstance(key, str):
+                raise TypeError(f"Asset key must be str, not {type(key).__name__}")
+            insort(self._keys, key)
         self._storage[key] = value
-        self._save()
+        self._changed()
 
     def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve asset by key."""
@@ -46,20 +184,45 @@ class AssetStore:
         """Delete asset by key. Returns True if deleted."""
         if key in self._storage:
             del self._storage[key]
-            self._save()
+            del self._keys[bisect_left(self._keys, key)]
+            self._changed()
             return True
         return False
 
+    def _prefix_range(self, prefix: str) -> range:
+        """Indices into _keys of the keys starting with prefix (two bisects)."""
+        keys = self._keys
+        end = _prefix_end(prefix)
+        hi = len(keys) if end is None else bisect_left(keys, end)
+        return range(bisect_left(keys, prefix), hi)
+
+    def iter(self, prefix: str = '') -> Iterator[str]:
+        """
+        Iterate keys like list(), without building the list first, so a
+        consumer can stop early. Don't store or delete keys while iterating.
+        """
+        if prefix:
+            keys = self._keys
+            for i in self._prefix_range(prefix):
+                yield keys[i]
+        else:
+            yield from self._storage
+
     def list(self, prefix: str = '') -> List[str]:
-        """List all keys with optional prefix filter."""
+        """
+        List all keys with optional prefix filter.
+        Without a prefix keys come in insertion order, with one in sorted order.
+        """
         if prefix:
-            return [k for k in self._storage.keys() if k.startswith(prefix)]
+            found = self._prefix_range(prefix)
+            return self._keys[found.start:found.stop]
         return list(self._storage.keys())
 
     def clear(self) -> None:
         """Clear all storage."""
         self._storage.clear()
-        self._save()
+        self._keys.clear()
+        self._changed()
 
 
 # Global store instance
@@ -81,6 +244,11 @@ def delete_asset(key: str) -> bool:
     return _store.delete(key)
 
 
+def iter_assets(prefix: str = '') -> Iterator[str]:
+    """Iterate asset keys lazily (see AssetStore.iter)."""
+    return _store.iter(prefix)
+
+
 def list_assets(prefix: str = '') -> List[str]:
     """List all asset keys."""
     return _store.list(prefix)
@@ -89,3 +257,16 @@ def list_assets(prefix: str = '') -> List[str]:
 def clear_storage() -> None:
     """Clear all storage."""
     _store.clear()
+
+
+def flush_storage() -> None:
+    """Save pending storage changes to disk."""
+    _store.flush()
+
+
+def bulk_storage() -> ContextManager[AssetStore]:
+    """Context manager deferring storage saves until the block exits."""
+    return _store.bulk()
+
+
+atexit.register(flush_storage)
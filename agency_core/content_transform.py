@@ -9,6 +9,8 @@ from typing import Any, Callable, Dict, List, Optional
 class Transform:
     """Transform definition."""
 
+    __slots__ = ('name', 'source_type', 'target_type', 'func')
+
     def __init__(self, name: str, source_type: str, target_type: str, func: Callable[[Any], Any]):
         self.name = name
         self.source_type = source_type
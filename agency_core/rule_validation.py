@@ -6,8 +6,10 @@ FROZEN MODULE - Pure stdlib
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
+from ._compat import _SLOTS
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Result of validation."""
     valid: bool
@@ -19,7 +21,7 @@ class ValidationResult:
             self.warnings = []
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationRule:
     """Validation rule definition."""
     name: str
@@ -33,10 +35,19 @@ class RuleRegistry:
 
     def __init__(self):
         self._rules: Dict[str, ValidationRule] = {}
+        # Split by severity at registration so validate() needs no per-rule branch
+        self._error_rules: Dict[str, ValidationRule] = {}
+        self._warning_rules: Dict[str, ValidationRule] = {}
 
     def register(self, rule: ValidationRule) -> None:
         """Register a validation rule."""
         self._rules[rule.name] = rule
+        self._error_rules.pop(rule.name, None)
+        self._warning_rules.pop(rule.name, None)
+        if rule.severity == "error":
+            self._error_rules[rule.name] = rule
+        else:
+            self._warning_rules[rule.name] = rule
 
     def get(self, name: str) -> Optional[ValidationRule]:
         """Get rule by name."""
@@ -53,20 +64,27 @@ class RuleRegistry:
         """
         all_errors = []
         all_warnings = []
+        add_errors = all_errors.extend
+        add_warnings = all_warnings.extend
+        error_rules = self._error_rules
+        warning_rules = self._warning_rules
 
         for rule_name in rule_names:
-            rule = self.get(rule_name)
-            if not rule:
+            rule = error_rules.get(rule_name)
+            if rule is not None:
+                result = rule.check(data)
+                add_errors(result.errors)
+                add_warnings(result.warnings)
+                continue
+
+            rule = warning_rules.get(rule_name)
+            if rule is None:
                 all_errors.append(f"Rule '{rule_name}' not found")
                 continue
 
             result = rule.check(data)
-            if rule.severity == "error":
-                all_errors.extend(result.errors)
-            else:
-                all_warnings.extend(result.errors)
-
-            all_warnings.extend(result.warnings)
+            add_warnings(result.errors)
+            add_warnings(result.warnings)
 
         return ValidationResult(
             valid=len(all_errors) == 0,
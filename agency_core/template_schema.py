@@ -3,11 +3,15 @@ Template Schema - Define and validate data structures
 FROZEN MODULE - Pure stdlib
 """
 
+from collections import ChainMap
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, Iterator, List, MutableMapping, Optional, Type
 
+from ._compat import _SLOTS
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class FieldDefinition:
     """Field definition in a template."""
     name: str
@@ -17,20 +21,81 @@ class FieldDefinition:
     description: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TemplateDefinition:
     """Template definition."""
     name: str
     fields: List[FieldDefinition]
     description: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _compiled: Callable[[Dict[str, Any]], List[str]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._compiled = _compile_validator(self.name, self.fields)
+
+
+def _compile_validator(name: str, fields: List[FieldDefinition]) -> Callable[[Dict[str, Any]], List[str]]:
+    """
+    Generate a straight-line validator for a template's fields.
+
+    Keys, types and error messages are bound as constants of the generated
+    function, so a validation call does no per-field attribute access,
+    branching on FieldDefinition flags, or message formatting beyond the
+    offending value's type name. Built once when the template is created.
+    """
+    namespace: Dict[str, Any] = {}
+    # Fast path, plain dicts only: required values are read directly and a
+    # missing one raises KeyError, falling back to the per-field presence
+    # checks. Other mappings skip it, as a failed lookup on them may call
+    # __missing__ (a defaultdict would gain the key).
+    fast = []
+    slow = []
+    for i, f in enumerate(fields):
+        type_name = getattr(f.type, '__name__', repr(f.type))
+        namespace[f"_k{i}"] = f.name
+        namespace[f"_t{i}"] = f.type
+        namespace[f"_missing{i}"] = f"Required field '{f.name}' missing"
+        namespace[f"_expects{i}"] = f"Field '{f.name}' expects {type_name}, got "
+        check = [
+            f"value = data[_k{i}]",
+            f"if value is not None and not isinstance(value, _t{i}):",
+            f"    errors.append(_expects{i} + type(value).__name__)",
+        ]
+        if f.required:
+            fast += ["            " + line for line in check]
+            slow += [
+                f"    if _k{i} not in data:",
+                f"        errors.append(_missing{i})",
+                "    else:",
+            ]
+        else:
+            fast.append(f"            if _k{i} in data:")
+            fast += ["                " + line for line in check]
+            slow.append(f"    if _k{i} in data:")
+        slow += ["        " + line for line in check]
+    lines = [
+        "def _validate(data):",
+        "    errors = []",
+        "    if type(data) is dict:",
+        "        try:",
+        *fast,
+        "            return errors",
+        "        except KeyError:",
+        "            errors = []",
+        *slow,
+        "    return errors",
+    ]
+    exec(compile("\n".join(lines), f"<template:{name}>", "exec"), namespace)
+    return namespace["_validate"]
 
 
 class TemplateRegistry:
     """Registry for template definitions."""
 
     def __init__(self):
-        self._templates: Dict[str, TemplateDefinition] = {}
+        self._templates: MutableMapping[str, TemplateDefinition] = {}
 
     def register(self, template: TemplateDefinition) -> None:
         """Register a template."""
@@ -56,22 +121,7 @@ class TemplateRegistry:
                 'errors': [f"Template '{template_name}' not found"]
             }
 
-        errors = []
-
-        for field_def in template.fields:
-            # Check required fields
-            if field_def.required and field_def.name not in data:
-                errors.append(f"Required field '{field_def.name}' missing")
-                continue
-
-            # Check type if value present
-            if field_def.name in data:
-                value = data[field_def.name]
-                if value is not None and not isinstance(value, field_def.type):
-                    errors.append(
-                        f"Field '{field_def.name}' expects {field_def.type.__name__}, "
-                        f"got {type(value).__name__}"
-                    )
+        errors = template._compiled(data)
 
         return {
             'valid': len(errors) == 0,
@@ -124,6 +174,19 @@ def validate_template_data(template_name: str, data: Dict[str, Any]) -> Dict[str
     return _registry.validate(template_name, data)
 
 
+def compile_validator(template_name: str) -> Callable[[Dict[str, Any]], List[str]]:
+    """
+    Return the template's compiled validator: data -> list of errors.
+    Lets hot loops skip the registry lookup and result dict per call.
+    The validator is generated when the template is defined, so look it up
+    again after redefining the template.
+    """
+    template = _registry.get(template_name)
+    if template is None:
+        raise ValueError(f"Template '{template_name}' not found")
+    return template._compiled
+
+
 def get_template(name: str) -> Optional[TemplateDefinition]:
     """Get template definition by name."""
     return _registry.get(name)
@@ -132,3 +195,18 @@ def get_template(name: str) -> Optional[TemplateDefinition]:
 def list_templates() -> List[str]:
     """List all registered template names."""
     return _registry.list()
+
+
+@contextmanager
+def scoped_registry() -> Iterator[None]:
+    """
+    Scope template definitions to a with-block (e.g. one test).
+    Templates defined inside are dropped on exit; those defined before stay
+    visible.
+    """
+    outer = _registry._templates
+    _registry._templates = ChainMap({}, outer)
+    try:
+        yield
+    finally:
+        _registry._templates = outer
@@ -6,8 +6,10 @@ FROZEN MODULE - Pure stdlib
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
+from ._compat import _SLOTS
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class WorkflowStep:
     """Single step in a workflow."""
     name: str
@@ -15,20 +17,40 @@ class WorkflowStep:
     description: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Workflow:
     """Workflow definition."""
     name: str
     steps: List[WorkflowStep]
     description: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _compiled: Callable[[Any], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._compiled = _compile_steps(self.name, self.steps)
 
     def execute(self, input_data: Any) -> Any:
         """Execute workflow steps sequentially."""
-        result = input_data
-        for step in self.steps:
-            result = step.func(result)
-        return result
+        return self._compiled(input_data)
+
+
+def _compile_steps(name: str, steps: List[WorkflowStep]) -> Callable[[Any], Any]:
+    """
+    Compose workflow steps into one straight-line function.
+
+    Each step function is bound as a constant of the generated code, so a
+    run makes one call per step with no loop, iterator or attribute access.
+    Built once when the workflow is created; later edits to `steps` are
+    not picked up.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _run(x):"]
+    for i, step in enumerate(steps):
+        namespace[f"_f{i}"] = step.func
+        lines.append(f"    x = _f{i}(x)")
+    lines.append("    return x")
+    exec(compile("\n".join(lines), f"<workflow:{name}>", "exec"), namespace)
+    return namespace["_run"]
 
 
 class WorkflowRegistry:
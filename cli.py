@@ -12,7 +12,12 @@ from pathlib import Path
 import click
 
 from extensions.social_posts import generate_social_post, batch_generate_social_posts
-from extensions.briefing_generator import generate_briefing, generate_briefing_from_csv, BriefingData
+from extensions.briefing_generator import (
+    generate_briefing,
+    generate_briefing_from_csv,
+    briefing_markdown_cache_info,
+    BriefingData
+)
 from extensions.folder_structure import (
     generate_folder_structure,
     generate_custom_structure,
@@ -76,7 +81,8 @@ def single(text, style, color, background, output):
 @social.command()
 @click.argument('csv_path', type=click.Path(exists=True))
 @click.option('--output', type=click.Path(), required=True, help='Output directory')
-def batch(csv_path, output):
+@click.option('--max-workers', type=int, default=None, help='Worker threads (default: based on CPU count)')
+def batch(csv_path, output, max_workers):
     """Generate social posts from CSV file.
 
     CSV format: text,style,color,background
@@ -85,7 +91,7 @@ def batch(csv_path, output):
     output_dir = Path(output)
 
     try:
-        assets = batch_generate_social_posts(csv_path, output_dir)
+        assets = batch_generate_social_posts(csv_path, output_dir, max_workers=max_workers)
         click.echo(f"✓ Generated {len(assets)} social posts")
         click.echo(f"  Output directory: {output_dir}")
     except Exception as e:
@@ -149,7 +155,9 @@ def single(client, project, project_type, goals, audience, timeline, budget, del
 @click.argument('csv_path', type=click.Path(exists=True))
 @click.option('--output', type=click.Path(), required=True, help='Output directory')
 @click.option('--format', type=click.Choice(['markdown', 'pdf']), default='markdown', help='Output format')
-def batch(csv_path, output, format):
+@click.option('--max-workers', type=int, default=None, help='Worker threads (default: based on CPU count)')
+@click.option('--cache-stats', is_flag=True, help='Show markdown cache hits/misses')
+def batch(csv_path, output, format, max_workers, cache_stats):
     """Generate briefings from CSV file.
 
     CSV format: client_name,project_name,project_type,goals,target_audience,timeline,budget,deliverables,additional_notes
@@ -159,9 +167,12 @@ def batch(csv_path, output, format):
     output_dir = Path(output)
 
     try:
-        assets = generate_briefing_from_csv(csv_path, output_dir, format)
+        assets = generate_briefing_from_csv(csv_path, output_dir, format, max_workers=max_workers)
         click.echo(f"✓ Generated {len(assets)} briefings")
         click.echo(f"  Output directory: {output_dir}")
+        if cache_stats:
+            info = briefing_markdown_cache_info()
+            click.echo(f"  Markdown cache: {info.hits} hits, {info.misses} misses")
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
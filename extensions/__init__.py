@@ -8,16 +8,30 @@ They use the frozen core modules as building blocks.
 
 __version__ = "1.0.0"
 
-from .social_posts import generate_social_post, batch_generate_social_posts
-from .briefing_generator import generate_briefing, BriefingData
-from .folder_structure import generate_folder_structure
-from .batch_processor import process_csv_workflow
-
-__all__ = [
-    'generate_social_post',
-    'batch_generate_social_posts',
-    'generate_briefing',
-    'BriefingData',
-    'generate_folder_structure',
-    'process_csv_workflow',
-]
+import importlib
+
+# Re-exports are resolved on first access (PEP 562), so importing
+# `extensions` does not import every extension module up front.
+_EXPORTS = {
+    'generate_social_post': 'social_posts',
+    'batch_generate_social_posts': 'social_posts',
+    'generate_briefing': 'briefing_generator',
+    'BriefingData': 'briefing_generator',
+    'generate_folder_structure': 'folder_structure',
+    'process_csv_workflow': 'batch_processor',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
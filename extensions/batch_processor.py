@@ -3,23 +3,78 @@ Batch Processor Extension - Process CSV files with workflows
 Uses: core.asset_io, core.workflow_process
 """
 
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from agency_core import asset_io, workflow_process, job_identity
 
 
+_EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+def threaded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Like ThreadPoolExecutor.map, but keep at most max_pending items in flight.
+
+    Executor.map submits the whole iterable up front, so a streamed CSV would
+    be parsed completely before the first result is consumed. Here items are
+    pulled only as results are yielded, overlapping parsing with the work.
+    Results are yielded in input order.
+
+    Args:
+        func: Function applied to each item
+        items: Input iterable (consumed lazily)
+        max_workers: Worker threads (None = ThreadPoolExecutor default)
+        max_pending: Items submitted but not yet yielded (default: 2x workers)
+    """
+    if max_pending is None:
+        # Same default pool size as ThreadPoolExecutor
+        max_pending = 2 * (max_workers or min(32, (os.cpu_count() or 1) + 4))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        submit = pool.submit
+        pending = deque()
+        for item in items:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(submit(func, item))
+        while pending:
+            yield pending.popleft().result()
+
+
 def process_csv_workflow(
     csv_path: Path,
     workflow_name: str,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    executor: str = "serial",  # serial, thread, process
+    max_workers: Optional[int] = None
 ) -> List[Any]:
     """
     Process CSV file through a workflow.
 
+    Rows are independent, so they can be fanned out to a worker pool:
+    "thread" suits IO-bound steps, "process" CPU-bound ones. With "process"
+    the workflow must be registered at import time of a module the workers
+    also import (or the platform must fork), and row results must pickle.
+    Results keep CSV row order either way.
+
     Args:
         csv_path: Path to CSV file
         workflow_name: Name of registered workflow
         output_dir: Optional output directory for results
+        executor: How to run rows (serial, thread, process)
+        max_workers: Pool size for thread/process executors
 
     Returns:
         List of workflow results
@@ -34,18 +89,23 @@ def process_csv_workflow(
     )
 
     try:
-        # Read CSV
-        rows = asset_io.read_csv(csv_path)
-
         if output_dir:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
+        run_row = partial(workflow_process.execute_workflow, workflow_name)
+
+        # Stream CSV in batches so parsing overlaps with workflow execution
         results = []
-        for i, row in enumerate(rows):
-            # Execute workflow for each row
-            result = workflow_process.execute_workflow(workflow_name, row)
-            results.append(result)
+        if executor == "serial":
+            for batch in asset_io.read_csv_batches(csv_path):
+                results.extend(map(run_row, batch))
+        elif executor in _EXECUTORS:
+            with _EXECUTORS[executor](max_workers=max_workers) as pool:
+                for batch in asset_io.read_csv_batches(csv_path):
+                    results.extend(pool.map(run_row, batch, chunksize=64))
+        else:
+            raise ValueError(f"Unknown executor: {executor}")
 
         # Log success
         job_identity.log_job_execution(
@@ -108,26 +168,27 @@ def batch_process_with_callback(
         params={"csv_path": str(csv_path)}
     )
 
-    rows = asset_io.read_csv(csv_path)
-
     if output_dir:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
     results = []
     errors = []
+    total = 0
+    # Bound once: the loop body runs per CSV row
+    add_result = results.append
+    add_error = errors.append
 
-    for i, row in enumerate(rows):
+    for i, row in enumerate(asset_io.iter_csv(csv_path)):
+        total += 1
         try:
-            result = process_func(row)
-            results.append(result)
+            add_result(process_func(row))
         except Exception as e:
-            error_info = {
+            add_error({
                 "row_index": i,
                 "row_data": row,
                 "error": str(e)
-            }
-            errors.append(error_info)
+            })
 
             if error_handling == "raise":
                 raise
@@ -140,7 +201,7 @@ def batch_process_with_callback(
         job.id,
         status=status,
         result={
-            "total_rows": len(rows),
+            "total_rows": total,
             "successful": len(results),
             "errors": len(errors)
         }
@@ -149,7 +210,7 @@ def batch_process_with_callback(
     return {
         "results": results,
         "errors": errors,
-        "total": len(rows),
+        "total": total,
         "successful": len(results),
         "failed": len(errors)
     }
@@ -3,10 +3,13 @@ Briefing Generator Extension - Generate project briefings
 Uses: core.asset_entity, core.content_transform, core.asset_io
 """
 
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from agency_core import asset_entity, asset_io, content_transform, job_identity, template_schema
+from extensions.batch_processor import threaded_map
 
 
 @dataclass
@@ -22,6 +25,23 @@ class BriefingData:
     deliverables: List[str]
     additional_notes: str = ""
 
+    def to_dict(self) -> dict:
+        """
+        Field dict with the lists copied (fields are flat, so this matches
+        dataclasses.asdict without its recursive deepcopy).
+        """
+        return {
+            'client_name': self.client_name,
+            'project_name': self.project_name,
+            'project_type': self.project_type,
+            'goals': list(self.goals),
+            'target_audience': self.target_audience,
+            'timeline': self.timeline,
+            'budget': self.budget,
+            'deliverables': list(self.deliverables),
+            'additional_notes': self.additional_notes,
+        }
+
 
 def setup_briefing_template():
     """Define briefing template."""
@@ -42,50 +62,105 @@ def setup_briefing_template():
     )
 
 
-def register_briefing_transforms():
-    """Register transforms for briefings."""
-
-    def briefing_to_markdown(data: dict) -> str:
-        """Convert briefing data to markdown."""
-        md = f"""# Project Briefing: {data['project_name']}
+@lru_cache(maxsize=512)
+def _render_briefing_markdown(
+    project_name, client_name, project_type, timeline, budget,
+    goals, target_audience, deliverables, additional_notes
+) -> str:
+    """Render briefing markdown from hashable field values (lists as tuples)."""
+    parts = [f"""# Project Briefing: {project_name}
 
 ## Client
-**{data['client_name']}**
+**{client_name}**
 
 ## Project Overview
-- **Type**: {data['project_type']}
-- **Timeline**: {data['timeline']}
-- **Budget**: {data['budget']}
+- **Type**: {project_type}
+- **Timeline**: {timeline}
+- **Budget**: {budget}
 
 ## Goals
-"""
-        for goal in data['goals']:
-            md += f"- {goal}\n"
+"""]
+    parts.extend(f"- {goal}\n" for goal in goals)
 
-        md += f"""
+    parts.append(f"""
 ## Target Audience
-{data['target_audience']}
+{target_audience}
 
 ## Deliverables
-"""
-        for deliverable in data['deliverables']:
-            md += f"- {deliverable}\n"
+""")
+    parts.extend(f"- {deliverable}\n" for deliverable in deliverables)
 
-        if data.get('additional_notes'):
-            md += f"""
+    if additional_notes:
+        parts.append(f"""
 ## Additional Notes
-{data['additional_notes']}
-"""
+{additional_notes}
+""")
 
-        return md
+    return "".join(parts)
 
-    def markdown_to_pdf_placeholder(markdown: str) -> bytes:
-        """
-        Convert markdown to PDF (placeholder).
-        In production, use fpdf, weasyprint, or pandoc.
-        """
-        # This is a placeholder - real implementation would generate PDF
+
+def briefing_markdown_cache_info():
+    """Hit/miss statistics of the briefing markdown cache (lives for the process)."""
+    return _render_briefing_markdown.cache_info()
+
+
+@lru_cache(maxsize=1)
+def _fpdf():
+    """fpdf2's (FPDF, XPos, YPos), or None when the pdf extra is not installed."""
+    try:
+        from fpdf import FPDF
+        from fpdf.enums import XPos, YPos
+    except ImportError:
+        return None
+    return FPDF, XPos, YPos
+
+
+def markdown_to_pdf(markdown: str) -> bytes:
+    """
+    Render briefing markdown to PDF with fpdf2 (pip install -e ".[pdf]").
+    Handles the subset briefings use: '#' headings and '**bold**' markers
+    (dropped); other lines are set as plain text. Without fpdf2 the UTF-8
+    markdown is returned.
+    """
+    fpdf = _fpdf()
+    if fpdf is None:
         return markdown.encode('utf-8')
+    FPDF, XPos, YPos = fpdf
+
+    pdf = FPDF()
+    pdf.add_page()
+    for line in markdown.splitlines():
+        # Core fonts only cover latin-1
+        text = line.replace('**', '').encode('latin-1', 'replace').decode('latin-1')
+        if not text.strip():
+            pdf.ln(4)
+            continue
+        if text.startswith('#'):
+            level = len(text) - len(text.lstrip('#'))
+            pdf.set_font('Helvetica', 'B', 18 if level == 1 else 14)
+            text = text.lstrip('#').strip()
+        else:
+            pdf.set_font('Helvetica', size=11)
+        pdf.multi_cell(0, 7, text, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    return bytes(pdf.output())
+
+
+def register_briefing_transforms():
+    """Register transforms for briefings."""
+
+    def briefing_to_markdown(data: dict) -> str:
+        """Convert briefing data to markdown (memoized on the field values)."""
+        key = (
+            data['project_name'], data['client_name'], data['project_type'],
+            data['timeline'], data['budget'], tuple(data['goals']),
+            data['target_audience'], tuple(data['deliverables']),
+            data.get('additional_notes'),
+        )
+        try:
+            return _render_briefing_markdown(*key)
+        except TypeError:
+            # Unhashable field values: render without the cache
+            return _render_briefing_markdown.__wrapped__(*key)
 
     content_transform.define_transform(
         name="briefing_to_markdown",
@@ -98,13 +173,20 @@ def register_briefing_transforms():
         name="markdown_to_pdf",
         source_type="markdown",
         target_type="pdf",
-        func=markdown_to_pdf_placeholder
+        func=markdown_to_pdf
     )
 
 
-# Initialize on import
-setup_briefing_template()
-register_briefing_transforms()
+def _ensure_briefing_registered() -> None:
+    """
+    Register the briefing template and transforms on first use, not on import.
+    Checks the registries on each call rather than caching a flag, which
+    would go stale if the template registry is swapped or scoped.
+    """
+    if template_schema.get_template("project_briefing") is None:
+        setup_briefing_template()
+    if content_transform.get_transform("markdown_to_pdf") is None:
+        register_briefing_transforms()
 
 
 def generate_briefing(
@@ -123,18 +205,20 @@ def generate_briefing(
     Returns:
         Asset entity representing the briefing
     """
+    _ensure_briefing_registered()
+
     # Create job for tracking
     job = job_identity.create_job(
         name="briefing_generation",
-        params=asdict(data)
+        params=data.to_dict()
     )
 
     try:
         # Validate data
-        data_dict = asdict(data)
-        validation = template_schema.validate_template_data("project_briefing", data_dict)
-        if not validation['valid']:
-            raise ValueError(f"Invalid briefing data: {validation['errors']}")
+        data_dict = data.to_dict()
+        errors = template_schema.compile_validator("project_briefing")(data_dict)
+        if errors:
+            raise ValueError(f"Invalid briefing data: {errors}")
 
         # Create asset entity
         briefing = asset_entity.create_asset("project_briefing", data_dict)
@@ -144,15 +228,17 @@ def generate_briefing(
 
         # Write file
         if output_dir:
+            # asset_io creates the directory on first write and caches it,
+            # so batch callers don't pay a mkdir per row
             output_dir = Path(output_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
 
+            safe_name = asset_io.sanitize_filename(data.project_name)
             if format == "markdown":
-                output_path = output_dir / f"{data.project_name.replace(' ', '_')}_briefing.md"
+                output_path = output_dir / f"{safe_name}_briefing.md"
                 asset_io.write_file(output_path, markdown_content)
             elif format == "pdf":
                 pdf_bytes = content_transform.apply_transform("markdown_to_pdf", markdown_content)
-                output_path = output_dir / f"{data.project_name.replace(' ', '_')}_briefing.pdf"
+                output_path = output_dir / f"{safe_name}_briefing.pdf"
                 asset_io.write_pdf(output_path, pdf_bytes)
             else:
                 raise ValueError(f"Unsupported format: {format}")
@@ -177,7 +263,12 @@ def generate_briefing(
         raise
 
 
-def generate_briefing_from_csv(csv_path: Path, output_dir: Path, format: str = "markdown") -> List[asset_entity.Asset]:
+def generate_briefing_from_csv(
+    csv_path: Path,
+    output_dir: Path,
+    format: str = "markdown",
+    max_workers: Optional[int] = None
+) -> List[asset_entity.Asset]:
     """
     Generate multiple briefings from CSV file.
 
@@ -185,28 +276,54 @@ def generate_briefing_from_csv(csv_path: Path, output_dir: Path, format: str = "
     client_name,project_name,project_type,goals,target_audience,timeline,budget,deliverables,additional_notes
 
     Note: goals and deliverables should be pipe-separated (|)
-    """
-    rows = asset_io.read_csv(csv_path)
-
-    assets = []
-    for row in rows:
-        # Parse pipe-separated lists
-        goals = row.get('goals', '').split('|') if row.get('goals') else []
-        deliverables = row.get('deliverables', '').split('|') if row.get('deliverables') else []
-
-        data = BriefingData(
-            client_name=row['client_name'],
-            project_name=row['project_name'],
-            project_type=row['project_type'],
-            goals=goals,
-            target_audience=row['target_audience'],
-            timeline=row['timeline'],
-            budget=row['budget'],
-            deliverables=deliverables,
-            additional_notes=row.get('additional_notes', '')
-        )
 
-        asset = generate_briefing(data, output_dir, format)
-        assets.append(asset)
-
-    return assets
+    Rows are generated on a thread pool, since each briefing is dominated
+    by file writes. max_workers=None uses the ThreadPoolExecutor default.
+    Rows are parsed only as workers free up, and assets are returned in
+    CSV row order. Rows that write the same file (same sanitized project
+    name) run one after another in CSV order, so the last one wins.
+    """
+    _ensure_briefing_registered()
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def chained_rows() -> Iterator[Tuple[dict, Optional[threading.Event], threading.Event]]:
+        # Pair each row with the completion event of the previous row that
+        # writes the same file. Rows are submitted in order, so that row is
+        # already running or done when a worker waits on it.
+        last_done: Dict[str, threading.Event] = {}
+        for row in asset_io.iter_csv(csv_path):
+            safe_name = asset_io.sanitize_filename(row.get('project_name') or '')
+            done = threading.Event()
+            yield row, last_done.get(safe_name), done
+            last_done[safe_name] = done
+
+    def generate_row(item: Tuple[dict, Optional[threading.Event], threading.Event]) -> asset_entity.Asset:
+        row, previous, done = item
+        try:
+            # Parse pipe-separated lists
+            goals = row.get('goals')
+            goals = goals.split('|') if goals else []
+            deliverables = row.get('deliverables')
+            deliverables = deliverables.split('|') if deliverables else []
+
+            data = BriefingData(
+                client_name=row['client_name'],
+                project_name=row['project_name'],
+                project_type=row['project_type'],
+                goals=goals,
+                target_audience=row['target_audience'],
+                timeline=row['timeline'],
+                budget=row['budget'],
+                deliverables=deliverables,
+                additional_notes=row.get('additional_notes', '')
+            )
+
+            if previous is not None:
+                previous.wait()
+            return generate_briefing(data, output_dir, format)
+        finally:
+            done.set()
+
+    return list(threaded_map(generate_row, chained_rows(), max_workers))
@@ -3,8 +3,9 @@ Folder Structure Extension - Generate project folder structures
 Uses: core.asset_io, core.asset_entity
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from agency_core import asset_entity, asset_io, job_identity
 
 
@@ -12,7 +13,7 @@ from agency_core import asset_entity, asset_io, job_identity
 FOLDER_STRUCTURES = {
     "agency_standard": {
         "name": "Agency Standard",
-        "structure": [
+        "structure": (
             "01_brief",
             "02_research",
             "03_concepts",
@@ -23,11 +24,11 @@ FOLDER_STRUCTURES = {
             "06_assets/images",
             "06_assets/fonts",
             "07_archive",
-        ]
+        )
     },
     "social_media": {
         "name": "Social Media Campaign",
-        "structure": [
+        "structure": (
             "01_brief_strategy",
             "02_content_calendar",
             "03_graphics",
@@ -37,11 +38,11 @@ FOLDER_STRUCTURES = {
             "04_copy",
             "05_final_exports",
             "06_analytics",
-        ]
+        )
     },
     "web_project": {
         "name": "Web Project",
-        "structure": [
+        "structure": (
             "01_brief",
             "02_research_ux",
             "03_wireframes",
@@ -52,11 +53,11 @@ FOLDER_STRUCTURES = {
             "05_assets/fonts",
             "06_development_handoff",
             "07_final_delivery",
-        ]
+        )
     },
     "branding": {
         "name": "Branding Project",
-        "structure": [
+        "structure": (
             "01_brief_research",
             "02_moodboards",
             "03_concepts",
@@ -67,11 +68,54 @@ FOLDER_STRUCTURES = {
             "06_applications/letterhead",
             "06_applications/social_media",
             "07_final_delivery",
-        ]
+        )
     }
 }
 
 
+@lru_cache(maxsize=64)
+def _readme_body(structure_name: str, folders: Tuple[str, ...]) -> str:
+    """
+    README text below the project title; only the title varies per project.
+    Cached on the structure's contents, so entries added to or changed in
+    FOLDER_STRUCTURES at runtime are picked up. Joined to the title by
+    concatenation, so braces in project names need no escaping.
+    """
+    parts = [f"""Project Type: **{structure_name}**
+
+## Folder Structure
+
+"""]
+    for folder in folders:
+        indent = "  " * (folder.count('/'))
+        folder_name = folder.split('/')[-1]
+        parts.append(f"{indent}- `{folder_name}/`\n")
+
+    parts.append("""
+## Usage
+
+This folder structure follows agency best practices for organized project management.
+
+- Keep all project files organized in their respective folders
+- Use clear naming conventions for files
+- Archive old versions in the `archive` folder
+""")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=128)
+def _leaf_folders(folders: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Folders that are not a parent of another entry, in their original order.
+    mkdir(parents=True) on these creates every folder in the list.
+    """
+    parts = [Path(folder).parts for folder in folders]
+    ancestors = {p[:i] for p in parts for i in range(1, len(p))}
+    return tuple(dict.fromkeys(
+        folder for folder, p in zip(folders, parts) if p not in ancestors
+    ))
+
+
 def generate_folder_structure(
     project_name: str,
     structure_type: str = "agency_standard",
@@ -108,6 +152,8 @@ def generate_folder_structure(
             )
 
         structure_def = FOLDER_STRUCTURES[structure_type]
+        # Tuple key for the content-keyed caches; runtime entries may use lists
+        folders = tuple(structure_def['structure'])
 
         # Create asset entity
         structure_asset = asset_entity.create_asset(
@@ -115,44 +161,22 @@ def generate_folder_structure(
             {
                 "project_name": project_name,
                 "structure_type": structure_type,
-                "folders": structure_def['structure']
+                "folders": list(folders)
             }
         )
 
         # Create folders if base_path provided
         if base_path:
             base_path = Path(base_path)
-            project_root = base_path / project_name.replace(' ', '_')
+            project_root = base_path / asset_io.sanitize_filename(project_name)
 
-            created_folders = []
-            for folder in structure_def['structure']:
-                folder_path = project_root / folder
-                folder_path.mkdir(parents=True, exist_ok=True)
-                created_folders.append(str(folder_path))
+            for folder in _leaf_folders(folders):
+                (project_root / folder).mkdir(parents=True, exist_ok=True)
+            created_folders = [str(project_root / folder) for folder in folders]
 
             # Create README if requested
             if create_readme:
-                readme_content = f"""# {project_name}
-
-Project Type: **{structure_def['name']}**
-
-## Folder Structure
-
-"""
-                for folder in structure_def['structure']:
-                    indent = "  " * (folder.count('/'))
-                    folder_name = folder.split('/')[-1]
-                    readme_content += f"{indent}- `{folder_name}/`\n"
-
-                readme_content += """
-## Usage
-
-This folder structure follows agency best practices for organized project management.
-
-- Keep all project files organized in their respective folders
-- Use clear naming conventions for files
-- Archive old versions in the `archive` folder
-"""
+                readme_content = f"# {project_name}\n\n" + _readme_body(structure_def['name'], folders)
 
                 readme_path = project_root / "README.md"
                 asset_io.write_file(readme_path, readme_content)
@@ -215,13 +239,11 @@ def generate_custom_structure(
 
         if base_path:
             base_path = Path(base_path)
-            project_root = base_path / project_name.replace(' ', '_')
+            project_root = base_path / asset_io.sanitize_filename(project_name)
 
-            created_folders = []
-            for folder in folders:
-                folder_path = project_root / folder
-                folder_path.mkdir(parents=True, exist_ok=True)
-                created_folders.append(str(folder_path))
+            for folder in _leaf_folders(tuple(folders)):
+                (project_root / folder).mkdir(parents=True, exist_ok=True)
+            created_folders = [str(project_root / folder) for folder in folders]
 
             structure_asset.metadata['created_folders'] = created_folders
             structure_asset.metadata['project_root'] = str(project_root)
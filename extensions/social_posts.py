@@ -6,6 +6,7 @@ Uses: core.asset_entity, core.content_transform, core.asset_io
 from pathlib import Path
 from typing import Dict, List, Optional
 from agency_core import asset_entity, asset_io, content_transform, job_identity, template_schema
+from extensions.batch_processor import threaded_map
 
 
 def setup_social_post_template():
@@ -47,9 +48,12 @@ def register_social_transforms():
     )
 
 
-# Initialize on import
-setup_social_post_template()
-register_social_transforms()
+def _ensure_social_registered() -> None:
+    """Register the social post template and transforms on first use, unless present."""
+    if template_schema.get_template("social_post") is None:
+        setup_social_post_template()
+    if content_transform.get_transform("text_to_social_image") is None:
+        register_social_transforms()
 
 
 def generate_social_post(
@@ -72,6 +76,8 @@ def generate_social_post(
     Returns:
         Asset entity representing the social post
     """
+    _ensure_social_registered()
+
     # Create job for tracking
     job = job_identity.create_job(
         name="social_post_generation",
@@ -121,7 +127,11 @@ def generate_social_post(
         raise
 
 
-def batch_generate_social_posts(csv_path: Path, output_dir: Path) -> List[asset_entity.Asset]:
+def batch_generate_social_posts(
+    csv_path: Path,
+    output_dir: Path,
+    max_workers: Optional[int] = None
+) -> List[asset_entity.Asset]:
     """
     Batch generate social posts from CSV file.
 
@@ -131,24 +141,23 @@ def batch_generate_social_posts(csv_path: Path, output_dir: Path) -> List[asset_
     Args:
         csv_path: Path to CSV file
         output_dir: Output directory for images
+        max_workers: Worker threads (None = ThreadPoolExecutor default)
 
     Returns:
-        List of generated assets
+        List of generated assets, in CSV row order
     """
-    rows = asset_io.read_csv(csv_path)
+    _ensure_social_registered()
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    assets = []
-    for row in rows:
-        asset = generate_social_post(
+    def generate_row(row: Dict) -> asset_entity.Asset:
+        return generate_social_post(
             text=row.get('text', ''),
             style=row.get('style', 'modern'),
             color=row.get('color', '#000000'),
             background=row.get('background', '#FFFFFF'),
             output_dir=output_dir
         )
-        assets.append(asset)
 
-    return assets
+    return list(threaded_map(generate_row, asset_io.iter_csv(csv_path), max_workers))
@@ -2,12 +2,20 @@
 Setup script for Agency Toolkit
 """
 
-from setuptools import setup, find_packages
+import sys
 from pathlib import Path
+from setuptools import setup
 
-# Read README
-readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text(encoding='utf-8') if readme_file.exists() else ""
+# Project directory, computed once (pure path arithmetic, no filesystem access)
+HERE = Path(__file__).parent
+
+# Read README only for commands that publish it as the long description;
+# metadata probes (egg_info, dist_info, develop) skip the file IO.
+long_description = ""
+if {"sdist", "bdist_wheel", "upload"}.intersection(sys.argv):
+    readme_file = HERE / "README.md"
+    if readme_file.exists():
+        long_description = readme_file.read_text(encoding='utf-8')
 
 setup(
     name="agency-toolkit",
@@ -17,7 +25,10 @@ setup(
     long_description_content_type="text/markdown",
     author="Agency Toolkit Team",
     python_requires=">=3.8",
-    packages=find_packages(exclude=["tests*", "examples*"]),
+    # Static list instead of a find_packages() tree walk; regenerate via:
+    # python -c "from setuptools import find_packages; print(find_packages(exclude=['tests*', 'examples*']))"
+    packages=["agency_core", "extensions"],
+    py_modules=["cli"],
     install_requires=[
         "click>=8.0.0",
     ],
@@ -30,7 +41,7 @@ setup(
             "Pillow>=9.0.0",
         ],
         "pdf": [
-            "fpdf2>=2.5.0",
+            "fpdf2>=2.5.2",
         ],
     },
     entry_points={
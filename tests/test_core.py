@@ -3,8 +3,6 @@ Tests for frozen core modules.
 """
 
 import pytest
-from pathlib import Path
-import tempfile
 import shutil
 
 from agency_core import (
@@ -16,68 +14,195 @@ from agency_core import (
 class TestAssetIO:
     """Test asset_io module."""
 
-    def test_read_write_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.txt"
-            content = "Hello World"
+    def test_read_write_file(self, tmp_path):
+        path = tmp_path / "test.txt"
+        content = "Hello World"
 
-            asset_io.write_file(path, content)
-            assert asset_io.read_file(path) == content
+        asset_io.write_file(path, content)
+        assert asset_io.read_file(path) == content
 
-    def test_read_write_json(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.json"
-            data = {"name": "test", "value": 123}
+    def test_write_recreates_removed_directory(self, tmp_path):
+        path = tmp_path / "out" / "test.txt"
+        asset_io.write_file(path, "first")
+        shutil.rmtree(path.parent)
 
-            asset_io.write_json(path, data)
-            assert asset_io.read_json(path) == data
+        asset_io.write_file(path, "second")
+        assert asset_io.read_file(path) == "second"
 
-    def test_read_write_csv(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.csv"
-            data = [
-                {"name": "Alice", "age": "30"},
-                {"name": "Bob", "age": "25"}
-            ]
+    def test_sanitize_filename(self):
+        assert asset_io.sanitize_filename("My Project/v2") == "My_Project_v2"
 
-            asset_io.write_csv(path, data)
-            result = asset_io.read_csv(path)
-            assert result == data
+    def test_read_write_json(self, tmp_path):
+        path = tmp_path / "test.json"
+        data = {"name": "test", "value": 123}
+
+        asset_io.write_json(path, data)
+        assert asset_io.read_json(path) == data
+
+    def test_read_write_csv(self, tmp_path):
+        path = tmp_path / "test.csv"
+        data = [
+            {"name": "Alice", "age": "30"},
+            {"name": "Bob", "age": "25"}
+        ]
+
+        asset_io.write_csv(path, data, fieldnames=["name", "age"])
+        result = asset_io.read_csv(path)
+        assert result == data
+
+    def test_read_csv_batches(self, tmp_path):
+        path = tmp_path / "test.csv"
+        asset_io.write_csv(path, [{"n": str(i)} for i in range(5)])
+
+        batches = list(asset_io.read_csv_batches(path, batch_size=2))
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_iter_csv_ragged_rows(self, tmp_path):
+        path = tmp_path / "test.csv"
+        asset_io.write_file(path, "a,b\n1\n\n1,2,3\n")
+
+        rows = list(asset_io.iter_csv(path))
+        assert rows == [{"a": "1", "b": None}, {"a": "1", "b": "2", None: ["3"]}]
 
 
 class TestAssetStorage:
     """Test asset_storage module."""
 
+    @pytest.fixture(autouse=True)
+    def _isolated_store(self, monkeypatch, tmp_path):
+        # Fresh store per test; nothing is written to the working directory
+        monkeypatch.setattr(asset_storage, "_store", asset_storage.AssetStore(tmp_path / "storage.json"))
+
     def test_store_retrieve(self):
-        asset_storage.clear_storage()
         asset_storage.store_asset("test_key", {"data": "value"})
         assert asset_storage.retrieve_asset("test_key") == {"data": "value"}
 
     def test_list_assets(self):
-        asset_storage.clear_storage()
         asset_storage.store_asset("test_1", "value1")
         asset_storage.store_asset("test_2", "value2")
         asset_storage.store_asset("other_1", "value3")
 
         all_keys = asset_storage.list_assets()
         assert len(all_keys) == 3
+        assert sum(1 for _ in asset_storage.iter_assets()) == 3
+        assert list(asset_storage.iter_assets(prefix="other_")) == ["other_1"]
 
         test_keys = asset_storage.list_assets(prefix="test_")
         assert len(test_keys) == 2
 
+        asset_storage.store_asset("test_0", "value0")
+        asset_storage.delete_asset("test_1")
+        assert asset_storage.list_assets(prefix="test_") == ["test_0", "test_2"]
+
+        # Prefix lookups bisect both ends of this sorted key index
+        # (O(log N + k)); it must track mutations
+        assert asset_storage._store._keys == ["other_1", "test_0", "test_2"]
+
+    def test_prefix_bounds(self, tmp_path):
+        store = asset_storage.AssetStore(tmp_path / "storage.json")
+        with store.bulk():
+            for key in ["a", "ab", "ab\U0010ffff", "ab\U0010ffffz", "ac", "b", "\U0010ffff", "\U0010ffffx"]:
+                store.store(key, 1)
+
+        assert store.list("ab") == ["ab", "ab\U0010ffff", "ab\U0010ffffz"]
+        assert list(store.iter("ab")) == store.list("ab")
+        assert store.list("\U0010ffff") == ["\U0010ffff", "\U0010ffffx"]
+        assert store.list("zz") == []
+
+    def test_key_order_and_type(self, tmp_path):
+        store = asset_storage.AssetStore(tmp_path / "storage.json")
+        for key in ["b2", "a", "b1"]:
+            store.store(key, 1)
+
+        # Insertion order without a prefix, sorted order with one
+        assert store.list() == ["b2", "a", "b1"]
+        assert store.list("b") == ["b1", "b2"]
+
+        with pytest.raises(TypeError, match="must be str"):
+            store.store(1, "value")
+        assert store.list() == ["b2", "a", "b1"]
+
+    def test_bulk_defers_save(self, tmp_path):
+        path = tmp_path / "storage.json"
+        store = asset_storage.AssetStore(path)
+
+        with store.bulk():
+            store.store("a", 1)
+            store.store("b", 2)
+            assert not path.exists()
+
+        assert asset_storage.AssetStore(path).retrieve("b") == 2
+
+    def test_save_replaces_file_atomically(self, tmp_path):
+        path = tmp_path / "storage.json"
+        store = asset_storage.AssetStore(path)
+        store.store("a", 1)
+        store.store("a", 2)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["storage.json"]
+        assert asset_storage.AssetStore(path).retrieve("a") == 2
+
+    def test_binary_values_roundtrip(self, tmp_path):
+        path = tmp_path / "storage.json"
+        store = asset_storage.AssetStore(path)
+        store.store("text", "value")
+        store.store("image", b"\x89PNG\x00")
+        store.store("empty", bytearray())
+
+        reloaded = asset_storage.AssetStore(path)
+        assert reloaded.retrieve("text") == "value"
+        assert reloaded.retrieve("image") == b"\x89PNG\x00"
+        assert reloaded.retrieve("empty") == b""
+
+        reloaded.delete("image")
+        reloaded.delete("empty")
+        assert [p.name for p in tmp_path.iterdir()] == ["storage.json"]
+
+    def test_torn_blob_pair_is_skipped(self, tmp_path):
+        path = tmp_path / "storage.json"
+        blob_path = tmp_path / "storage.json.blobs"
+        store = asset_storage.AssetStore(path)
+        store.store("image", b"old")
+        old_blobs = blob_path.read_bytes()
+
+        # Crash after the storage file was replaced, before the stale
+        # blob file was removed
+        store.store("image", "new")
+        blob_path.write_bytes(old_blobs)
+        assert asset_storage.AssetStore(path).retrieve("image") == "new"
+
+        # Crash after the blob file was replaced, before the storage file
+        old_payload = path.read_bytes()
+        store.store("image", b"newer")
+        store.store("other", 1)
+        path.write_bytes(old_payload)
+        reloaded = asset_storage.AssetStore(path)
+        assert reloaded.retrieve("image") == "new"
+        assert reloaded.retrieve("other") is None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_template():
+    template_schema.define_template(
+        name="test_template",
+        fields=[
+            {"name": "field1", "type": str, "required": True},
+            {"name": "field2", "type": int, "required": False}
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def _scoped_templates():
+    # Templates a test defines don't leak into other tests
+    with template_schema.scoped_registry():
+        yield
+
 
 class TestTemplateSchema:
     """Test template_schema module."""
 
     def test_define_and_validate_template(self):
-        template_schema.define_template(
-            name="test_template",
-            fields=[
-                {"name": "field1", "type": str, "required": True},
-                {"name": "field2", "type": int, "required": False}
-            ]
-        )
-
         # Valid data
         result = template_schema.validate_template_data(
             "test_template",
@@ -93,91 +218,165 @@ class TestTemplateSchema:
         assert result['valid'] is False
         assert len(result['errors']) > 0
 
+        # Invalid data (wrong type)
+        result = template_schema.validate_template_data(
+            "test_template",
+            {"field1": "value", "field2": "123"}
+        )
+        assert result['errors'] == ["Field 'field2' expects int, got str"]
+
+        validate = template_schema.compile_validator("test_template")
+        assert validate({"field1": "value"}) == []
+        assert validate({"field2": 123}) == ["Required field 'field1' missing"]
+        assert validate({"field2": "123"}) == [
+            "Required field 'field1' missing",
+            "Field 'field2' expects int, got str",
+        ]
+
+    def test_validate_does_not_mutate_missing_mapping(self):
+        from collections import defaultdict
+        data = defaultdict(str, field2=123)
+
+        validate = template_schema.compile_validator("test_template")
+        assert validate(data) == ["Required field 'field1' missing"]
+        assert dict(data) == {"field2": 123}
+
+    def test_scoped_registry(self):
+        with template_schema.scoped_registry():
+            template_schema.define_template(name="test_scoped", fields=[])
+            assert "test_scoped" in template_schema.list_templates()
+            assert template_schema.get_template("test_template") is not None
+
+        assert template_schema.get_template("test_scoped") is None
+
 
 class TestAssetEntity:
     """Test asset_entity module."""
 
-    def test_create_asset(self):
-        asset = asset_entity.create_asset(
-            "test_type",
-            {"name": "test", "value": 123}
-        )
+    @pytest.mark.parametrize("typ,init,update", [
+        ("test_type", {"name": "test", "value": 123}, None),
+        ("test", {"value": 1}, {"value": 2}),
+    ])
+    def test_asset_lifecycle(self, typ, init, update):
+        asset = asset_entity.create_asset(typ, init)
 
-        assert asset.type == "test_type"
-        assert asset.data["name"] == "test"
+        assert asset.type == typ
+        assert asset.data == init
         assert asset.id is not None
 
-    def test_update_asset(self):
-        asset = asset_entity.create_asset("test", {"value": 1})
-        updated = asset_entity.update_asset(asset.id, {"value": 2})
+        if update:
+            asset = asset_entity.update_asset(asset.id, update)
+            assert asset.data == {**init, **update}
 
-        assert updated.data["value"] == 2
+    def test_to_dict_roundtrip(self):
+        asset = asset_entity.create_asset("test", {"value": 1}, {"source": "test"})
+        result = asset_entity.Asset.from_dict(asset.to_dict())
+
+        assert result == asset
+
+    def test_from_dict_whole_second_timestamps(self):
+        # isoformat() omits the fraction when microsecond == 0
+        from datetime import datetime
+        stamp = datetime(2024, 1, 2, 3, 4, 5)
+        asset = asset_entity.Asset("id", "test", {}, stamp, stamp)
+
+        assert asset_entity.Asset.from_dict(asset.to_dict()).created_at == stamp
 
     def test_list_by_type(self):
-        asset_entity.create_asset("type_a", {})
-        asset_entity.create_asset("type_a", {})
-        asset_entity.create_asset("type_b", {})
+        created = asset_entity.create_assets("type_a", [{}, {}])
+        asset_entity.create_assets("type_b", [{}])
+
+        assert [asset_entity.get_asset(a.id) for a in created] == created
 
         type_a_assets = asset_entity.list_assets_by_type("type_a")
         assert len([a for a in type_a_assets if a.type == "type_a"]) >= 2
 
+    def test_delete_updates_type_index(self):
+        asset = asset_entity.create_asset("type_deleted", {})
+
+        assert asset_entity.delete_asset_entity(asset.id) is True
+        assert asset_entity.list_assets_by_type("type_deleted") == []
+
+    def test_delete_after_type_reassigned(self):
+        asset = asset_entity.create_asset("type_before", {})
+        asset.type = "type_after"
+
+        assert asset_entity.delete_asset_entity(asset.id) is True
+        assert asset_entity.get_asset(asset.id) is None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _register_transform():
+    content_transform.define_transform(
+        name="test_uppercase",
+        source_type="string",
+        target_type="string",
+        func=str.upper
+    )
+
 
 class TestContentTransform:
     """Test content_transform module."""
 
     def test_define_and_apply_transform(self):
-        def uppercase_transform(data):
-            return data.upper()
-
-        content_transform.define_transform(
-            name="test_uppercase",
-            source_type="string",
-            target_type="string",
-            func=uppercase_transform
-        )
-
         result = content_transform.apply_transform("test_uppercase", "hello")
         assert result == "HELLO"
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _register_workflow():
+    def step1(data):
+        return data + 1
+
+    def step2(data):
+        return data * 2
+
+    workflow_process.define_workflow(
+        name="test_workflow",
+        steps=[
+            {"name": "add_one", "func": step1},
+            {"name": "multiply_two", "func": step2}
+        ]
+    )
+
+
 class TestWorkflowProcess:
     """Test workflow_process module."""
 
     def test_define_and_execute_workflow(self):
-        def step1(data):
-            return data + 1
-
-        def step2(data):
-            return data * 2
-
-        workflow_process.define_workflow(
-            name="test_workflow",
-            steps=[
-                {"name": "add_one", "func": step1},
-                {"name": "multiply_two", "func": step2}
-            ]
-        )
-
         result = workflow_process.execute_workflow("test_workflow", 5)
         assert result == 12  # (5 + 1) * 2
 
+        # Steps are composed into one generated function at definition time
+        compiled = workflow_process.get_workflow("test_workflow")._compiled
+        assert compiled.__code__.co_filename == "<workflow:test_workflow>"
+        assert compiled(0) == 2
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_rules():
+    from agency_core.rule_validation import ValidationResult
+
+    def check_positive(data):
+        if data > 0:
+            return ValidationResult(valid=True, errors=[])
+        else:
+            return ValidationResult(valid=False, errors=["Value must be positive"])
+
+    def check_short(data):
+        return ValidationResult(valid=len(data) < 5, errors=[] if len(data) < 5 else ["Too long"])
+
+    rule_validation.define_rule(
+        name="test_positive",
+        check=check_positive
+    )
+    rule_validation.define_rule(name="test_short", check=check_short, severity="warning")
+
 
 class TestRuleValidation:
     """Test rule_validation module."""
 
     def test_define_and_validate_rule(self):
-        def check_positive(data):
-            from agency_core.rule_validation import ValidationResult
-            if data > 0:
-                return ValidationResult(valid=True, errors=[])
-            else:
-                return ValidationResult(valid=False, errors=["Value must be positive"])
-
-        rule_validation.define_rule(
-            name="test_positive",
-            check=check_positive
-        )
-
         # Valid data
         result = rule_validation.validate_asset(10, ["test_positive"])
         assert result.valid is True
@@ -187,6 +386,11 @@ class TestRuleValidation:
         assert result.valid is False
         assert len(result.errors) > 0
 
+    def test_warning_severity(self):
+        result = rule_validation.validate_asset("too long", ["test_short", "test_missing"])
+        assert result.warnings == ["Too long"]
+        assert result.errors == ["Rule 'test_missing' not found"]
+
 
 class TestJobIdentity:
     """Test job_identity module."""
@@ -210,6 +414,23 @@ class TestJobIdentity:
 
         # Retrieve job
         retrieved = job_identity.get_job(job.id)
-        assert retrieved is not None
+        assert retrieved is job
         assert len(retrieved.executions) == 1
         assert retrieved.executions[0].status == "completed"
+
+    def test_timestamps_use_module_clock(self, monkeypatch):
+        from datetime import datetime
+        fixed = datetime(2024, 1, 2, 3, 4, 5)
+        monkeypatch.setattr(job_identity, "_now", lambda: fixed)
+
+        job = job_identity.create_job(name="test_job", params={})
+        job_identity.log_job_execution(job.id, status="completed")
+
+        assert job.created_at == fixed
+        assert job.executions[0].timestamp == fixed
+
+    def test_to_dict_roundtrip(self):
+        job = job_identity.create_job(name="test_job", params={"param1": "value1"})
+        job_identity.log_job_execution(job.id, status="failed", error="boom")
+
+        assert job_identity.Job.from_dict(job.to_dict()) == job
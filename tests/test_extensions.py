@@ -2,56 +2,166 @@
 Tests for extension modules.
 """
 
+import subprocess
+import sys
 import pytest
 from pathlib import Path
-import tempfile
 
-from extensions.social_posts import generate_social_post
-from extensions.briefing_generator import generate_briefing, BriefingData
-from extensions.folder_structure import generate_folder_structure, list_available_structures
+from extensions.social_posts import generate_social_post, batch_generate_social_posts
+from extensions import briefing_generator
+from extensions.briefing_generator import (
+    generate_briefing, generate_briefing_from_csv, briefing_markdown_cache_info, BriefingData
+)
+from extensions.folder_structure import (
+    FOLDER_STRUCTURES, generate_folder_structure, generate_custom_structure,
+    list_available_structures
+)
+from extensions.batch_processor import process_csv_workflow, define_batch_workflow, threaded_map
+from agency_core import asset_io, template_schema
+
+
+@pytest.fixture
+def sample_briefing():
+    """Briefing input; a fresh instance per test, as its list fields are mutable."""
+    return BriefingData(
+        client_name="Test Client",
+        project_name="Test Project",
+        project_type="Web Development",
+        goals=["Goal 1", "Goal 2"],
+        target_audience="Test audience",
+        timeline="3 months",
+        budget="$10,000",
+        deliverables=["Deliverable 1", "Deliverable 2"]
+    )
 
 
 class TestSocialPosts:
     """Test social_posts extension."""
 
-    def test_generate_social_post(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            asset = generate_social_post(
-                text="Test post",
-                style="modern",
-                output_dir=Path(tmpdir)
-            )
+    def test_generate_social_post(self, tmp_path):
+        asset = generate_social_post(
+            text="Test post",
+            style="modern",
+            output_dir=tmp_path
+        )
 
-            assert asset.type == "social_post"
-            assert asset.data["text"] == "Test post"
-            assert "output_path" in asset.metadata
+        assert asset.type == "social_post"
+        assert asset.data["text"] == "Test post"
+        assert "output_path" in asset.metadata
 
+    def test_batch_generate_keeps_row_order(self, tmp_path):
+        csv_path = tmp_path / "posts.csv"
+        asset_io.write_csv(csv_path, [{"text": f"Post {i}"} for i in range(20)])
 
-class TestBriefingGenerator:
-    """Test briefing_generator extension."""
+        assets = batch_generate_social_posts(csv_path, tmp_path / "out", max_workers=4)
+        assert [a.data["text"] for a in assets] == [f"Post {i}" for i in range(20)]
 
-    def test_generate_briefing(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data = BriefingData(
-                client_name="Test Client",
-                project_name="Test Project",
-                project_type="Web Development",
-                goals=["Goal 1", "Goal 2"],
-                target_audience="Test audience",
-                timeline="3 months",
-                budget="$10,000",
-                deliverables=["Deliverable 1", "Deliverable 2"]
-            )
 
-            asset = generate_briefing(data, output_dir=Path(tmpdir), format="markdown")
-
-            assert asset.type == "project_briefing"
-            assert asset.data["project_name"] == "Test Project"
-            assert "output_path" in asset.metadata
+class TestBriefingGenerator:
+    """Test briefing_generator extension."""
 
-            # Check file was created
-            output_path = Path(asset.metadata["output_path"])
-            assert output_path.exists()
+    def test_generate_briefing(self, sample_briefing, tmp_path):
+        asset = generate_briefing(sample_briefing, output_dir=tmp_path, format="markdown")
+
+        assert asset.type == "project_briefing"
+        assert asset.data["project_name"] == "Test Project"
+
+        # Check file was created (a missing output_path fails the lookup)
+        output_path = Path(asset.metadata["output_path"])
+        assert output_path.is_file()
+
+    def test_generate_briefing_pdf(self, sample_briefing, tmp_path):
+        asset = generate_briefing(sample_briefing, output_dir=tmp_path, format="pdf")
+
+        output_path = Path(asset.metadata["output_path"])
+        assert output_path.name == "Test_Project_briefing.pdf"
+        assert output_path.stat().st_size > 0
+
+    def test_markdown_to_pdf_renders_pdf(self):
+        pytest.importorskip("fpdf")
+        pdf = briefing_generator.markdown_to_pdf("# Title\n\n**Bold** text\n- item\n")
+        assert pdf.startswith(b"%PDF-")
+
+    def test_markdown_to_pdf_without_fpdf(self, monkeypatch):
+        monkeypatch.setattr(briefing_generator, "_fpdf", lambda: None)
+        markdown = "# Title\n\nCaf\u00e9 \u2713\n"
+        assert briefing_generator.markdown_to_pdf(markdown) == markdown.encode("utf-8")
+
+    def test_to_dict_copies_lists(self, sample_briefing):
+        from dataclasses import asdict
+        result = sample_briefing.to_dict()
+        assert result == asdict(sample_briefing)
+        assert result['goals'] is not sample_briefing.goals
+
+    def test_first_use_inside_scoped_registry(self, sample_briefing, monkeypatch):
+        # Fresh registry, so the template isn't already defined outside the scope
+        monkeypatch.setattr(template_schema, "_registry", template_schema.TemplateRegistry())
+
+        with template_schema.scoped_registry():
+            generate_briefing(sample_briefing)
+        assert template_schema.get_template("project_briefing") is None
+
+        # Registered again rather than failing with 'Template not found'
+        assert generate_briefing(sample_briefing).type == "project_briefing"
+
+    def test_csv_rows_sharing_a_file_keep_row_order(self, tmp_path):
+        csv_path = tmp_path / "briefings.csv"
+        asset_io.write_csv(csv_path, [
+            {
+                "client_name": f"Client {i}", "project_name": "Same Project",
+                "project_type": "Web", "goals": "Goal", "target_audience": "All",
+                "timeline": "1 month", "budget": "$1", "deliverables": "Site",
+                "additional_notes": "",
+            }
+            for i in range(8)
+        ])
+
+        assets = generate_briefing_from_csv(csv_path, tmp_path / "out", max_workers=8)
+        assert [a.data["client_name"] for a in assets] == [f"Client {i}" for i in range(8)]
+
+        # The last row wins, as when rows ran serially
+        content = (tmp_path / "out" / "Same_Project_briefing.md").read_text()
+        assert "**Client 7**" in content
+
+    def test_markdown_cached_per_field_values(self):
+        data = BriefingData(
+            client_name="Cache Client",
+            project_name="Cache Project",
+            project_type="Branding",
+            goals=["Goal"],
+            target_audience="Everyone",
+            timeline="1 month",
+            budget="$1,000",
+            deliverables=["Logo"]
+        )
+        generate_briefing(data)
+        hits = briefing_markdown_cache_info().hits
+
+        generate_briefing(data)
+        assert briefing_markdown_cache_info().hits == hits + 1
+
+
+class TestLazyRegistration:
+    """Extension templates and transforms are registered on first use."""
+
+    def test_import_does_not_register(self):
+        # Importing an extension no longer defines its template/transforms;
+        # the first generate_* call (or the setup_*/register_* functions) does.
+        # Runs in a fresh interpreter, since other tests already registered them.
+        code = "\n".join([
+            "from agency_core import content_transform, template_schema",
+            "from extensions import briefing_generator, social_posts",
+            "assert template_schema.get_template('project_briefing') is None",
+            "assert content_transform.get_transform('briefing_to_markdown') is None",
+            "assert template_schema.get_template('social_post') is None",
+            "briefing_generator.generate_briefing(briefing_generator.BriefingData(",
+            "    'Client', 'Project', 'Web', [], 'All', '1 month', '$1', []))",
+            "social_posts.generate_social_post('Post')",
+            "assert template_schema.get_template('project_briefing') is not None",
+            "assert content_transform.get_transform('briefing_to_markdown') is not None",
+            "assert template_schema.get_template('social_post') is not None",
+        ])
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
 
 
 class TestFolderStructure:
@@ -62,18 +172,81 @@ class TestFolderStructure:
         assert len(structures) > 0
         assert "agency_standard" in structures
 
-    def test_generate_folder_structure(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            asset = generate_folder_structure(
-                project_name="Test Project",
-                structure_type="agency_standard",
-                base_path=Path(tmpdir)
-            )
-
-            assert asset.type == "folder_structure"
-            assert "project_root" in asset.metadata
-
-            # Check folders were created
+    def test_runtime_structure(self, tmp_path):
+        FOLDER_STRUCTURES["test_runtime"] = {"name": "Runtime", "structure": ["a", "a/b"]}
+        try:
+            asset = generate_folder_structure("Runtime", "test_runtime", base_path=tmp_path)
             project_root = Path(asset.metadata["project_root"])
-            assert project_root.exists()
-            assert (project_root / "README.md").exists()
+            assert (project_root / "a" / "b").is_dir()
+
+            # Changed entries aren't served from a stale cache
+            FOLDER_STRUCTURES["test_runtime"]["structure"] = ["c"]
+            asset = generate_folder_structure("Runtime", "test_runtime", base_path=tmp_path)
+            assert (project_root / "c").is_dir()
+            assert "`c/`" in (project_root / "README.md").read_text()
+        finally:
+            del FOLDER_STRUCTURES["test_runtime"]
+
+    def test_generate_folder_structure(self, tmp_path):
+        asset = generate_folder_structure(
+            project_name="Test Project",
+            structure_type="agency_standard",
+            base_path=tmp_path
+        )
+
+        assert asset.type == "folder_structure"
+        assert "project_root" in asset.metadata
+
+        # Check folders were created
+        project_root = Path(asset.metadata["project_root"])
+        assert project_root.exists()
+        assert (project_root / "README.md").exists()
+
+    def test_custom_structure_creates_every_folder(self, tmp_path):
+        folders = ["docs", "src", "src/components", "src/components/ui", "tests"]
+        asset = generate_custom_structure("Custom", folders, base_path=tmp_path)
+
+        created = asset.metadata["created_folders"]
+        assert len(created) == len(folders)
+        assert all(Path(folder).is_dir() for folder in created)
+
+
+class TestBatchProcessor:
+    """Test batch_processor extension."""
+
+    def test_process_csv_workflow(self, tmp_path):
+        csv_path = tmp_path / "rows.csv"
+        asset_io.write_csv(csv_path, [{"name": "alice"}, {"name": "bob"}])
+
+        define_batch_workflow(
+            name="test_batch_upper",
+            steps=[{"name": "upper", "func": lambda row: row["name"].upper()}]
+        )
+
+        results = process_csv_workflow(csv_path, "test_batch_upper")
+        assert results == ["ALICE", "BOB"]
+
+    def test_process_csv_workflow_thread_pool(self, tmp_path):
+        csv_path = tmp_path / "rows.csv"
+        asset_io.write_csv(csv_path, [{"n": str(i)} for i in range(100)])
+
+        define_batch_workflow(
+            name="test_batch_int",
+            steps=[{"name": "to_int", "func": lambda row: int(row["n"])}]
+        )
+
+        results = process_csv_workflow(csv_path, "test_batch_int", executor="thread", max_workers=4)
+        assert results == list(range(100))
+
+    def test_threaded_map_bounds_pending_items(self):
+        pulled = []
+
+        def items():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        results = threaded_map(lambda i: i * 2, items(), max_workers=2, max_pending=3)
+        assert next(results) == 0
+        assert len(pulled) <= 4
+        assert list(results) == [i * 2 for i in range(1, 10)]